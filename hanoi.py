@@ -15,6 +15,7 @@ Created on Feb 15, 2018.
 """
 
 EMPTY = 0  # Represents an empty space in a Tower
+TOWER_NUMBERS = (1, 2, 3)  # How Towers are referred to in configurations
 HELP_MESSAGE = ('Welcome to the Tower of Hanoi program!' 
                 + '\nYour goal is to get all the Disks from the leftmost Tower to '
                 + 'the rightmost.'
@@ -45,35 +46,70 @@ class InvalidMoveError(Exception):
     pass
 
 
-class InvalidFirstMoveError(Exception):
-    """Raised when the player does not make his first move from
-    Tower 1.
+class InvalidFirstMoveError(NoDisksError):
+    """Formerly raised when the player did not make his first move from
+    Tower 1. Since Games can now start from any configuration, moving
+    from an empty Tower raises NoDisksError instead; this class is kept
+    so that existing except clauses still work.
     """
     pass
 
 
 class Game:
     """Represents a session of Tower of Hanoi. There are 3 Towers in
-    the game; at the beginning, the first Tower is full of Disks, and
-    the other 2 Towers are empty. 
+    the game; by default, the first Tower is full of Disks at the
+    beginning, the other 2 Towers are empty, and the game is over when
+    the third Tower is full of Disks.
+
+    Any other legal start and goal can be given as configurations: a
+    sequence whose element k is the number (1, 2, or 3) of the Tower
+    that the Disk with size k + 1 is on. For example, (2, 2, 1) means
+    that Disks 1 and 2 are on Tower 2, and Disk 3 is on Tower 1.
     
     To make moves, call the move_disk_to() method
     on the Towers.
     """
-    def __init__(self, num_disks_per_tower: int):
+    def __init__(self, num_disks_per_tower: int, start=None, goal=None):
         if not isinstance(num_disks_per_tower, int):
             raise TypeError('num_disks_per_tower is not an integer.')
         
-        self.tower_one = Tower(num_disks_per_tower)
-        self.tower_two = Tower(num_disks_per_tower, empty=True)
-        self.tower_three = Tower(num_disks_per_tower, empty=True)
+        if start is None:
+            start = (1,) * num_disks_per_tower
+        if goal is None:
+            goal = (3,) * num_disks_per_tower
+        
+        self.start = _check_configuration(start, num_disks_per_tower)
+        self.goal = _check_configuration(goal, num_disks_per_tower)
         
-        self.min_moves_required = 2**num_disks_per_tower - 1
+        self.tower_one = _make_tower(self.start, 1)
+        self.tower_two = _make_tower(self.start, 2)
+        self.tower_three = _make_tower(self.start, 3)
+        
+        self.min_moves_required = solve(self.start, self.goal)[0]
         self.num_moves_made = 0
         
     def is_over(self) -> bool:
-        """Return True if self.tower_three is totally full of Disks."""
-        return all(disk != EMPTY for disk in self.tower_three)
+        """Return True if the Disks are arranged like self.goal."""
+        return self.get_configuration() == self.goal
+    
+    def get_configuration(self) -> tuple:
+        """Return the current configuration of the Disks, in the same
+        format as the start and goal configurations.
+        """
+        configuration = [EMPTY] * len(self.tower_one.disks)
+        towers = [self.tower_one, self.tower_two, self.tower_three]
+        
+        for tower_number, tower in zip(TOWER_NUMBERS, towers):
+            for disk in tower:
+                if disk != EMPTY:
+                    configuration[disk.size - 1] = tower_number
+        return tuple(configuration)
+    
+    def solution(self) -> (int, 'iterator'):
+        """Return solve() applied to the current configuration and
+        self.goal.
+        """
+        return solve(self.get_configuration(), self.goal)
     
     def print_towers(self) -> None:
         """Print all three Towers side by side."""
@@ -132,9 +168,6 @@ class Tower:
         other_tower will be in the correct order. Invalid moves will not
         affect Disk ordering in self, either.
         """
-        if all(disk != EMPTY for disk in other_tower):
-            raise InvalidFirstMoveError('1st move must be from Tower 1.')
-        
         this_tower_topmost_disk = self._get_and_remove_smallest_disk()
         
         # Because Disks have to go down as far as possible into
@@ -144,8 +177,9 @@ class Tower:
         #
         # Note that due to the way the Tower of Hanoi is structured,
         # there is never an instance in which we are trying to move
-        # a Disk into a Tower already full of Disks. Only one Tower
-        # can be full of Disks at any time.
+        # a Disk into a Tower already full of Disks. If other_tower is
+        # full, this Tower is empty, and we have already raised
+        # NoDisksError above.
         farthest_empty_index_down = (
             other_tower.get_bottommost_empty_space_index())
         
@@ -229,3 +263,196 @@ class Tower:
             self._current_index += 1
             return current_disk
         raise StopIteration
+
+
+def _check_configuration(configuration, num_disks: int) -> tuple:
+    """Return configuration as a tuple, raising ValueError if it is not
+    a legal configuration of num_disks Disks.
+    """
+    configuration = tuple(configuration)
+    if len(configuration) != num_disks:
+        raise ValueError('configuration must give a Tower for each of the '
+                         + str(num_disks) + ' Disks.')
+    if any(tower_number not in TOWER_NUMBERS
+           for tower_number in configuration):
+        raise ValueError('configuration must only contain 1, 2, or 3.')
+    return configuration
+
+
+def _make_tower(configuration: tuple, tower_number: int) -> Tower:
+    """Return a Tower holding the Disks that configuration puts on the
+    Tower numbered tower_number.
+    """
+    num_disks = len(configuration)
+    tower = Tower(num_disks, empty=True)
+    
+    sizes = [size for size, number in enumerate(configuration, 1)
+             if number == tower_number]
+    
+    # Disks always go as far down the Tower as possible, so the
+    # Disks on this Tower fill the bottom of tower.disks.
+    first_disk_index = num_disks - len(sizes)
+    for index, size in enumerate(sizes, first_disk_index):
+        tower[index] = Disk(size)
+    return tower
+
+
+def solve(start, goal) -> (int, 'iterator'):
+    """Return a 2-tuple where the first element is the minimum number of
+    moves needed to get from the start configuration to the goal
+    configuration, and the second element a lazy iterator over those
+    moves. Each move is a 2-tuple (from_tower, to_tower) of Tower
+    numbers.
+    
+    Disks larger than every Disk whose Tower differs between start and
+    goal never move. The largest Disk that does have to move goes
+    either straight to its goal Tower, or through the third Tower first;
+    an optimal solution never moves it more than twice, so comparing
+    those two options gives the answer in O(n).
+    """
+    start = _check_configuration(start, len(start))
+    goal = _check_configuration(goal, len(start))
+    
+    num_smaller_disks = len(start) - 1
+    while num_smaller_disks >= 0 and (start[num_smaller_disks]
+                                      == goal[num_smaller_disks]):
+        num_smaller_disks -= 1
+    
+    if num_smaller_disks < 0:
+        return (0, iter(()))
+    
+    # The Disk with size num_smaller_disks + 1 has to move from
+    # from_tower to to_tower; other_tower is the remaining Tower.
+    from_tower = start[num_smaller_disks]
+    to_tower = goal[num_smaller_disks]
+    other_tower = _other_tower(from_tower, to_tower)
+    
+    direct_moves = (_count_gather_moves(start, num_smaller_disks, other_tower)
+                    + 1
+                    + _count_gather_moves(goal, num_smaller_disks, other_tower))
+    
+    indirect_moves = (_count_gather_moves(start, num_smaller_disks, to_tower)
+                      + 1 + (2**num_smaller_disks - 1) + 1
+                      + _count_gather_moves(goal, num_smaller_disks, from_tower))
+    
+    if direct_moves <= indirect_moves:
+        return (direct_moves,
+                _direct_moves(start, goal, num_smaller_disks,
+                              from_tower, to_tower, other_tower))
+    return (indirect_moves,
+            _indirect_moves(start, goal, num_smaller_disks,
+                            from_tower, to_tower, other_tower))
+
+
+def _direct_moves(start, goal, num_smaller_disks: int, from_tower: int,
+                  to_tower: int, other_tower: int):
+    """Yield the moves of a solution in which the largest Disk that has
+    to move goes straight from from_tower to to_tower.
+    """
+    yield from _gather_moves(start, num_smaller_disks, other_tower)
+    yield (from_tower, to_tower)
+    yield from _scatter_moves(goal, num_smaller_disks, other_tower)
+
+
+def _indirect_moves(start, goal, num_smaller_disks: int, from_tower: int,
+                    to_tower: int, other_tower: int):
+    """Yield the moves of a solution in which the largest Disk that has
+    to move goes from from_tower to other_tower, and then to to_tower.
+    """
+    yield from _gather_moves(start, num_smaller_disks, to_tower)
+    yield (from_tower, other_tower)
+    yield from _perfect_tower_moves(num_smaller_disks, to_tower, from_tower)
+    yield (other_tower, to_tower)
+    yield from _scatter_moves(goal, num_smaller_disks, from_tower)
+
+
+def _other_tower(tower_number: int, another_tower_number: int) -> int:
+    """Return the number of the Tower that is neither tower_number nor
+    another_tower_number.
+    """
+    return 6 - tower_number - another_tower_number
+
+
+def _gather_steps(configuration, num_disks: int, tower_number: int) -> list:
+    """Return the steps needed to gather the num_disks smallest Disks of
+    configuration onto the Tower numbered tower_number, smallest Disk
+    first. Each step is a 4-tuple (size, from_tower, to_tower,
+    resting_tower): first move the Disk with that size from from_tower
+    to to_tower, then move all smaller Disks from resting_tower on top
+    of it.
+    
+    Disks already on the right Tower need no step.
+    """
+    steps = []
+    for size in range(num_disks, 0, -1):
+        disk_tower = configuration[size - 1]
+        if disk_tower != tower_number:
+            resting_tower = _other_tower(disk_tower, tower_number)
+            steps.append((size, disk_tower, tower_number, resting_tower))
+            tower_number = resting_tower
+    steps.reverse()
+    return steps
+
+
+def _count_gather_moves(configuration, num_disks: int,
+                        tower_number: int) -> int:
+    """Return the number of moves needed to gather the num_disks
+    smallest Disks of configuration onto the Tower numbered
+    tower_number.
+    """
+    # The step for the Disk with size k takes 1 + (2**(k - 1) - 1)
+    # == 2**(k - 1) moves, so the total is a binary number with one
+    # bit set per step. Building it from a string avoids doing
+    # O(n)-bit additions once per Disk.
+    bits = ['0'] * (num_disks + 1)
+    for step in _gather_steps(configuration, num_disks, tower_number):
+        bits[-step[0]] = '1'
+    return int(''.join(bits), 2)
+
+
+def _gather_moves(configuration, num_disks: int, tower_number: int):
+    """Yield the moves needed to gather the num_disks smallest Disks of
+    configuration onto the Tower numbered tower_number.
+    """
+    for size, from_tower, to_tower, resting_tower in _gather_steps(
+            configuration, num_disks, tower_number):
+        yield (from_tower, to_tower)
+        yield from _perfect_tower_moves(size - 1, resting_tower, to_tower)
+
+
+def _scatter_moves(configuration, num_disks: int, tower_number: int):
+    """Yield the moves needed to get the num_disks smallest Disks from
+    the Tower numbered tower_number into configuration. These are the
+    moves of _gather_moves() undone in reverse order.
+    """
+    for size, from_tower, to_tower, resting_tower in reversed(_gather_steps(
+            configuration, num_disks, tower_number)):
+        yield from _perfect_tower_moves(size - 1, to_tower, resting_tower)
+        yield (to_tower, from_tower)
+
+
+def _perfect_tower_moves(num_disks: int, from_tower: int, to_tower: int):
+    """Yield the 2**num_disks - 1 moves needed to move the num_disks
+    smallest Disks, all stacked on the Tower numbered from_tower, onto
+    the Tower numbered to_tower.
+    
+    This does not use recursion, so it works for any num_disks.
+    """
+    # In the optimal solution, every Disk always moves in the same
+    # direction around the Towers, and the Disk moved on move number i
+    # is one more than the number of trailing zeros of i. Disks whose
+    # size has the same parity as num_disks go from from_tower towards
+    # to_tower; the others go the other way.
+    forward = (to_tower - from_tower) % 3
+    steps = [EMPTY] + [forward if (num_disks - size) % 2 == 0 else 3 - forward
+                       for size in range(1, num_disks + 1)]
+    positions = [from_tower - 1] * (num_disks + 1)
+    
+    move_number = 1
+    last_move_number = 2**num_disks
+    while move_number < last_move_number:
+        size = (move_number & -move_number).bit_length()
+        old_position = positions[size]
+        positions[size] = (old_position + steps[size]) % 3
+        yield (old_position + 1, positions[size] + 1)
+        move_number += 1
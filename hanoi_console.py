@@ -4,8 +4,13 @@ Created on Feb 19, 2018
 
 @author: SirIsaacNeutron
 """
+import shutil
+import sys
+
 import hanoi
 
+PROMPT_ROWS = 6  # Rows below the board kept for prompts and messages
+
 
 def _get_game() -> hanoi.Game:
     """Ask the user how many Disks per Tower that he wants, and
@@ -21,17 +26,19 @@ def _get_game() -> hanoi.Game:
             print('Error: please type in a whole number.')
 
 
-def _determine_if_user_wants_help_message() -> None:
-    """Print a help message if the user so desires, else do nothing."""
+def _determine_if_user_wants_help_message() -> bool:
+    """Print a help message if the user so desires, else do nothing.
+    Return True if the help message was printed.
+    """
     while True:
         yes_or_no = input('Do you want to see instructions on how to play '
                           + 'Tower of Hanoi? (Type yes or no)\n')
         
         if yes_or_no.startswith('y') or yes_or_no.startswith('Y'):
             _print_help_message()
-            break
+            return True
         elif yes_or_no.startswith('n') or yes_or_no.startswith('N'):
-            break
+            return False
         else:
             print("Error: must type 'yes' or 'no'")
   
@@ -64,8 +71,6 @@ def _update_game(game: hanoi.Game) -> hanoi.Game:
               + 'the Disks they are on top of.')
     except hanoi.NoDisksError:
         print('Error: No Disks in a Tower you specified.')
-    except hanoi.InvalidFirstMoveError:
-        print('Error: Your first move must be from Tower 1!')
     return game
 
 
@@ -91,16 +96,170 @@ def _get_towers_involved_in_move() -> (str, str):
     return (original_tower, new_tower)
 
   
+class TerminalRenderer:
+    """Draws a Game on an ANSI terminal. The board is drawn once at the
+    top of the screen; after that, each call to draw() only rewrites the
+    cells that changed, using one write per frame. Prompts scroll in
+    their own region under the board, so they never move it.
+    
+    If the board is taller than the terminal, every Tower shows only its
+    topmost Disks, and a '+N' cell at the bottom of the Tower tells how
+    many more Disks are under them.
+    """
+    def __init__(self, stream=None, terminal_size=None):
+        # terminal_size is an os.terminal_size; if it is None, the size
+        # of the terminal is checked on every frame.
+        self._stream = sys.stdout if stream is None else stream
+        self._terminal_size = terminal_size
+        self._last_terminal_size = None
+        self._cells = {}
+        
+    def draw(self, game: hanoi.Game) -> None:
+        """Update the screen to show the current state of game."""
+        terminal_size = self._get_terminal_size()
+        if terminal_size != self._last_terminal_size:
+            self._last_terminal_size = terminal_size
+            self._draw_everything(game)
+            return
+        
+        changes = []
+        for position, cell in self._get_cells(game).items():
+            if self._cells.get(position) != cell:
+                changes.append(_move_cursor_to(*position) + cell)
+                self._cells[position] = cell
+        
+        if changes:
+            # Save the cursor, which is in the prompt region, and put it
+            # back after updating the board.
+            self._write('\x1b7' + ''.join(changes) + '\x1b8')
+    
+    def close(self) -> None:
+        """Give the whole terminal back to normal output, and put the
+        cursor on a new line under everything on the screen.
+        """
+        if self._last_terminal_size is not None:
+            self._write('\x1b[r'
+                        + _move_cursor_to(self._last_terminal_size.lines, 1)
+                        + '\n')
+    
+    def _draw_everything(self, game: hanoi.Game) -> None:
+        """Clear the screen and draw the whole board."""
+        self._cells = self._get_cells(game)
+        
+        prompt_row = self._get_num_board_rows(game) + 2
+        frame = ['\x1b[r\x1b[2J', _move_cursor_to(1, 1),
+                 self._get_header(game)]
+        for position, cell in self._cells.items():
+            frame.append(_move_cursor_to(*position) + cell)
+        
+        # Setting the scroll region moves the cursor to the top left, so
+        # the cursor has to be moved to the prompt region afterwards.
+        frame.append('\x1b[' + str(prompt_row) + ';'
+                     + str(self._last_terminal_size.lines) + 'r')
+        frame.append(_move_cursor_to(prompt_row, 1))
+        self._write(''.join(frame))
+    
+    def _get_cells(self, game: hanoi.Game) -> dict:
+        """Return a dict mapping each (row, column) of the board to the
+        text that should be there.
+        """
+        num_rows = self._get_num_board_rows(game)
+        cell_width = _get_cell_width(game)
+        towers = [game.tower_one, game.tower_two, game.tower_three]
+        
+        cells = {}
+        for tower_index, tower in enumerate(towers):
+            column = 1 + tower_index * (cell_width + 1)
+            tower_cells = _get_tower_cells(tower, num_rows, cell_width)
+            for row, cell in enumerate(tower_cells, 2):
+                cells[(row, column)] = cell
+        return cells
+    
+    def _get_header(self, game: hanoi.Game) -> str:
+        """Return the line with the Tower numbers above the board."""
+        cell_width = _get_cell_width(game)
+        return ' '.join(str(number).center(cell_width)
+                        for number in hanoi.TOWER_NUMBERS)
+    
+    def _get_num_board_rows(self, game: hanoi.Game) -> int:
+        """Return how many rows of Disks fit on the screen, at most one
+        per Disk in a Tower.
+        """
+        rows_available = self._last_terminal_size.lines - 1 - PROMPT_ROWS
+        return min(len(game.tower_one.disks), max(2, rows_available))
+    
+    def _get_terminal_size(self):
+        if self._terminal_size is not None:
+            return self._terminal_size
+        return shutil.get_terminal_size()
+    
+    def _write(self, text: str) -> None:
+        self._stream.write(text)
+        self._stream.flush()
+
+
+def _get_cell_width(game: hanoi.Game) -> int:
+    """Return how many characters wide a cell must be to show the
+    biggest Disk of game.
+    """
+    return len(str(len(game.tower_one.disks))) + 2
+
+
+def _get_tower_cells(tower: hanoi.Tower, num_rows: int,
+                     cell_width: int) -> list:
+    """Return the num_rows cells showing tower, from top to bottom."""
+    topmost_index = tower.get_bottommost_empty_space_index() + 1
+    disks = tower.disks[topmost_index:]
+    
+    if len(disks) <= num_rows:
+        empty_cell = '[' + ' ' * (cell_width - 2) + ']'
+        return ([empty_cell] * (num_rows - len(disks))
+                + [_get_disk_cell(disk, cell_width) for disk in disks])
+    
+    num_hidden_disks = len(disks) - (num_rows - 1)
+    return ([_get_disk_cell(disk, cell_width) for disk in disks[:num_rows - 1]]
+            + [('+' + str(num_hidden_disks)).center(cell_width)])
+
+
+def _get_disk_cell(disk: hanoi.Disk, cell_width: int) -> str:
+    return '[' + str(disk.size).rjust(cell_width - 2) + ']'
+
+
+def _move_cursor_to(row: int, column: int) -> str:
+    """Return the ANSI escape code that moves the cursor to row and
+    column, both counted from 1.
+    """
+    return '\x1b[' + str(row) + ';' + str(column) + 'H'
+
+
+def _play_in_terminal(game: hanoi.Game) -> None:
+    """Let the user play game, drawing it with a TerminalRenderer."""
+    renderer = TerminalRenderer()
+    try:
+        while not game.is_over():
+            renderer.draw(game)
+            game = _update_game(game)
+        renderer.draw(game)
+    finally:
+        renderer.close()
+
+
 if __name__ == '__main__':
     game = _get_game()
-    _determine_if_user_wants_help_message()
+    showed_help_message = _determine_if_user_wants_help_message()
     
-    while not game.is_over():
+    if sys.stdout.isatty():
+        # The board is drawn on a cleared screen, so give the user time
+        # to read the instructions first.
+        if showed_help_message:
+            input('Press Enter to start playing.\n')
+        _play_in_terminal(game)
+    else:
+        while not game.is_over():
+            game.print_towers()
+            game = _update_game(game)
         game.print_towers()
-        game = _update_game(game)
-                
-    game.print_towers()
+    
     print('Congratulations, you solved the puzzle!')
     print('Minimum number of moves required:', game.min_moves_required)
     print('Number of moves you made:', game.num_moves_made)
-    
\ No newline at end of file
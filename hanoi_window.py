@@ -159,9 +159,6 @@ class HanoiWindow:
             self._move_string.set("Invalid move! You can't put a bigger Disk on top of a "
                                   + 'smaller Disk.')
             return None
-        except hanoi.InvalidFirstMoveError:
-            self._move_string.set('Error: you have to make your first move from Tower 1!')
-            return None
         except hanoi.NoDisksError:
             self._move_string.set('Error: ' + self._origin + ' has no Disks!')
             return None
@@ -76,5 +76,73 @@ class HanoiTest(unittest.TestCase):
         disk_three = hanoi.Disk(1)
         self.assertFalse(disk_one.is_smaller_than(disk_three))
         
+    def test_game_custom_start_and_goal(self):
+        # Disks 1 and 3 start on Tower 1, Disk 2 on Tower 3; the goal
+        # is to gather all Disks on Tower 2.
+        game = hanoi.Game(3, start=(1, 3, 1), goal=(2, 2, 2))
+        self.assertEqual(game.tower_one[1].size, 1)
+        self.assertEqual(game.tower_one[2].size, 3)
+        self.assertEqual(game.tower_three[2].size, 2)
+        self.assertEqual(game.get_configuration(), (1, 3, 1))
+        self.assertFalse(game.is_over())
+        
+        game.tower_one.move_disk_to(game.tower_three)
+        game.tower_one.move_disk_to(game.tower_two)
+        game.tower_three.move_disk_to(game.tower_one)
+        game.tower_three.move_disk_to(game.tower_two)
+        game.tower_one.move_disk_to(game.tower_two)
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.min_moves_required, 5)
+        
+    def test_game_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            hanoi.Game(3, start=(1, 2))
+        with self.assertRaises(ValueError):
+            hanoi.Game(3, goal=(1, 2, 4))
+            
+    def test_move_from_empty_tower(self):
+        game = hanoi.Game(2)
+        with self.assertRaises(hanoi.NoDisksError):
+            game.tower_two.move_disk_to(game.tower_one)
+            
+    def test_solve_canonical(self):
+        num_moves, moves = hanoi.solve((1, 1, 1), (3, 3, 3))
+        self.assertEqual(num_moves, 7)
+        self.assertEqual(list(moves), [(1, 3), (1, 2), (3, 2), (1, 3),
+                                       (2, 1), (2, 3), (1, 3)])
+        
+    def test_solve_already_solved(self):
+        num_moves, moves = hanoi.solve((2, 1), (2, 1))
+        self.assertEqual(num_moves, 0)
+        self.assertEqual(list(moves), [])
+        
+    def test_solve_largest_disk_moves_twice(self):
+        # Moving Disk 3 straight from Tower 2 to Tower 1 would take
+        # 3 + 1 + 3 == 7 moves; going through Tower 3 takes 5.
+        num_moves, moves = hanoi.solve((1, 1, 2), (2, 2, 1))
+        self.assertEqual(num_moves, 5)
+        self.assertEqual(list(moves), [(2, 3), (1, 3), (1, 2), (3, 2),
+                                       (3, 1)])
+        
+    def test_solve_solution_plays_through_game(self):
+        game = hanoi.Game(6, start=(2, 1, 3, 3, 1, 2), goal=(1, 3, 2, 1, 3, 3))
+        towers = {1: game.tower_one, 2: game.tower_two, 3: game.tower_three}
+        
+        num_moves, moves = game.solution()
+        for from_tower, to_tower in moves:
+            towers[from_tower].move_disk_to(towers[to_tower])
+            game.num_moves_made += 1
+        
+        self.assertTrue(game.is_over())
+        self.assertEqual(game.num_moves_made, num_moves)
+        self.assertEqual(num_moves, game.min_moves_required)
+        
+    def test_solve_large_number_of_disks(self):
+        start = (1,) * 2000
+        goal = (3,) * 2000
+        num_moves, moves = hanoi.solve(start, goal)
+        self.assertEqual(num_moves, 2**2000 - 1)
+        self.assertEqual(next(moves), (1, 2))
+        
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
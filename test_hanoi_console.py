@@ -0,0 +1,88 @@
+'''
+@author: SirIsaacNeutron
+'''
+import io
+import os
+import unittest
+
+import hanoi
+import hanoi_console
+
+class TerminalRendererTest(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+
+    def _make_renderer(self, lines: int) -> hanoi_console.TerminalRenderer:
+        return hanoi_console.TerminalRenderer(
+            self.stream, os.terminal_size((80, lines)))
+
+    def _get_new_output(self) -> str:
+        output = self.stream.getvalue()
+        self.stream.seek(0)
+        self.stream.truncate()
+        return output
+
+    def test_first_draw_draws_everything(self):
+        game = hanoi.Game(3)
+        renderer = self._make_renderer(24)
+        renderer.draw(game)
+
+        output = self._get_new_output()
+        self.assertTrue(output.startswith('\x1b[r\x1b[2J'))
+        self.assertIn(' 1   2   3 ', output)
+        self.assertIn('\x1b[4;1H[3]', output)
+        self.assertIn('\x1b[4;9H[ ]', output)
+
+        # The prompts scroll under the board, from row 5 down.
+        self.assertTrue(output.endswith('\x1b[5;24r\x1b[5;1H'))
+
+    def test_draw_only_updates_changed_cells(self):
+        game = hanoi.Game(3)
+        renderer = self._make_renderer(24)
+        renderer.draw(game)
+        self._get_new_output()
+
+        renderer.draw(game)
+        self.assertEqual(self._get_new_output(), '')
+
+        game.tower_one.move_disk_to(game.tower_three)
+        renderer.draw(game)
+        self.assertEqual(self._get_new_output(),
+                         '\x1b7\x1b[2;1H[ ]\x1b[4;9H[1]\x1b8')
+
+    def test_tall_board_is_compressed(self):
+        game = hanoi.Game(200)
+        renderer = self._make_renderer(24)
+        renderer.draw(game)
+
+        # 24 lines, minus the header and the prompt rows, leaves 17
+        # rows: 16 Disks and a cell counting the other 184.
+        output = self._get_new_output()
+        self.assertIn('\x1b[17;1H[ 16]', output)
+        self.assertIn('\x1b[18;1H +184', output)
+        self.assertNotIn('[ 17]', output)
+        self.assertIn('\x1b[18;13H[   ]', output)
+
+    def test_resize_draws_everything_again(self):
+        game = hanoi.Game(3)
+        renderer = hanoi_console.TerminalRenderer(self.stream)
+
+        renderer._terminal_size = os.terminal_size((80, 24))
+        renderer.draw(game)
+        self._get_new_output()
+
+        renderer._terminal_size = os.terminal_size((80, 30))
+        renderer.draw(game)
+        self.assertIn('\x1b[5;30r', self._get_new_output())
+
+    def test_close_resets_scroll_region(self):
+        game = hanoi.Game(3)
+        renderer = self._make_renderer(24)
+        renderer.draw(game)
+        self._get_new_output()
+
+        renderer.close()
+        self.assertEqual(self._get_new_output(), '\x1b[r\x1b[24;1H\n')
+
+if __name__ == '__main__':
+    unittest.main()